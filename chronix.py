@@ -8,21 +8,20 @@ import os
 import sys
 import json
 import datetime
-
-import gi
-gi.require_version("Gtk", "3.0")
-gi.require_version("Gst", "1.0")
-gi.require_version("Notify", "0.7")
-from gi.repository import Gtk, GLib, Gst, Notify
-
-import matplotlib
-matplotlib.use("GTK3Agg")
-from matplotlib.backends.backend_gtk3agg import FigureCanvasGTK3Agg as FigureCanvas
-from matplotlib.figure import Figure
-
-# Initialize GStreamer and notifications
-Gst.init(None)
-Notify.init("Chronix")
+import collections
+import threading
+
+# orjson is optional; it parses and encodes straight to bytes several
+# times faster than the stdlib codec. Both branches deal in bytes so the
+# save/load paths don't care which one is active.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _loads = json.loads
 
 # Determine XDG config directory for settings
 if 'XDG_CONFIG_HOME' in os.environ:
@@ -41,9 +40,9 @@ if not os.path.isdir(assets_dir):
     assets_dir = script_dir
 default_focus_sound = os.path.join(assets_dir, 'focus_end.wav')
 default_break_sound = os.path.join(assets_dir, 'break_end.wav')
-default_icon = os.path.join(assets_dir, '/assets/icon.png')
+default_icon = os.path.join(assets_dir, 'icon.png')
 
-# Load or initialize settings
+# Default settings
 default_settings = {
     "focus_duration": 25,
     "short_break": 5,
@@ -59,53 +58,116 @@ default_settings = {
     "alarm_long": "",
     # Add any other default keys here that your app uses
 }
-def load_settings():
-    try:
-        with open("settings.json", "r") as f:
-            settings = json.load(f)
-    except FileNotFoundError:
-        settings = {}
-
+# Keep the stats history bounded: the chart only ever reads the last
+# week, so entries beyond the retention window are dead weight that
+# every save would re-serialize
+STATS_RETENTION_DAYS = 90
+
+def _prune_stats(data):
+    cutoff = (datetime.date.today() -
+              datetime.timedelta(days=STATS_RETENTION_DAYS)).isoformat()
+    # ISO date keys sort lexicographically, so string compare suffices
+    return {k: v for k, v in data.items() if k >= cutoff}
+
+def _load_data():
+    """Load settings and stats from disk into module globals.
+
+    Runs on a worker thread started before the GTK/GStreamer imports so
+    the disk reads overlap their import and init cost; the main thread
+    joins the loader before building the window.
+    """
+    global settings, stats
+    if os.path.isfile(settings_file):
+        try:
+            with open(settings_file, 'rb') as f:
+                settings = _loads(f.read())
+        except Exception as e:
+            print("Error loading settings, using defaults:", e)
+            settings = default_settings.copy()
+    else:
+        settings = default_settings.copy()
     # Ensure all defaults are present
-    for key, value in default_settings  .items():
+    for key, value in default_settings.items():
         settings.setdefault(key, value)
 
-    return settings
-if os.path.isfile(settings_file):
-    try:
-        with open(settings_file) as f:
-            settings = json.load(f)
-    except Exception as e:
-        print("Error loading settings, using defaults:", e)
-        settings = default_settings.copy()
-else:
-    settings = default_settings.copy()
-
-# Load or initialize stats (minutes of focus per day)
-if os.path.isfile(stats_file):
-    try:
-        with open(stats_file) as f:
-            stats = json.load(f)
-    except Exception as e:
-        print("Error loading stats, starting fresh:", e)
+    # Load or initialize stats (minutes of focus per day)
+    if os.path.isfile(stats_file):
+        try:
+            with open(stats_file, 'rb') as f:
+                stats = _loads(f.read())
+        except Exception as e:
+            print("Error loading stats, starting fresh:", e)
+            stats = {}
+    else:
         stats = {}
-else:
-    stats = {}
+    # defaultdict(int) keeps the session-end accumulation to a single
+    # lookup; it still serializes as a plain JSON object
+    stats = collections.defaultdict(int, _prune_stats(stats))
+
+_loader = threading.Thread(target=_load_data)
+_loader.start()
+
+import gi
+gi.require_version("Gtk", "3.0")
+gi.require_version("Gst", "1.0")
+gi.require_version("Notify", "0.7")
+from gi.repository import Gtk, GLib, Gst, Notify
+
+# Initialize GStreamer and notifications
+Gst.init(None)
+Notify.init("Chronix")
+
+# Helpers to save settings and stats to JSON. Saves are debounced
+# through a short GLib timeout so bursts of changes (e.g. a held
+# spin-button arrow) coalesce into one write, and each write goes to a
+# temp file renamed into place so a crash can't leave a torn file.
+_settings_flush_id = 0
+_stats_flush_id = 0
+
+def _write_json(path, obj):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_dumps(obj))
+    os.replace(tmp, path)
 
-# Helper to save settings and stats to JSON
 def save_settings():
+    # Restart the countdown on every change so the write lands once the
+    # input has quiesced rather than mid-burst
+    global _settings_flush_id
+    if _settings_flush_id:
+        GLib.source_remove(_settings_flush_id)
+    _settings_flush_id = GLib.timeout_add(250, _flush_settings)
+
+def _flush_settings():
+    global _settings_flush_id
+    _settings_flush_id = 0
     try:
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=2)
+        _write_json(settings_file, settings)
     except Exception as e:
         print("Error saving settings:", e)
+    return False
 
 def save_stats():
+    global _stats_flush_id
+    if not _stats_flush_id:
+        _stats_flush_id = GLib.timeout_add(500, _flush_stats)
+
+def _flush_stats():
+    global _stats_flush_id, stats
+    _stats_flush_id = 0
     try:
-        with open(stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        stats = collections.defaultdict(int, _prune_stats(stats))
+        _write_json(stats_file, stats)
     except Exception as e:
         print("Error saving stats:", e)
+    return False
+
+# Settings key holding the duration (minutes) for each session type
+DURATION_KEYS = {
+    "Focus": "focus_duration",
+    "Short Break": "short_break",
+    "Long Break": "long_break",
+}
 
 class ChronixTimer(Gtk.Window):
     def __init__(self):
@@ -116,7 +178,12 @@ class ChronixTimer(Gtk.Window):
         self.focus_count = 0
         self.current_session = "Focus"
         self.remaining = 0
+        self.deadline = 0
         self.timer_id = None
+        self._last_time_text = None
+        self._last_session_text = None
+        self._player = None
+        self._uri_cache = {}
 
         # Create Notebook for tabs
         self.notebook = Gtk.Notebook()
@@ -134,19 +201,24 @@ class ChronixTimer(Gtk.Window):
         self.settings_box = Gtk.VBox(spacing=6)
         self.notebook.append_page(self.settings_box, Gtk.Label(label="Settings"))
 
-        # Build UI in each tab
+        # Build the timer tab now; stats and settings are built on first
+        # visit so startup doesn't pay for matplotlib or widgets the user
+        # may never look at
         self.build_timer_tab()
-        self.build_stats_tab()
-        self.build_settings_tab()
+        self._stats_built = False
+        self._chart_dirty = False
+        self._stats_cache_day = None
+        self._stats_keys = None
+        self._today_date = None
+        self._today_iso = None
+        self._settings_built = False
+        self.notebook.connect("switch-page", self.on_tab_switch)
 
         # Tray icon
         self.status_icon = None
         self.build_tray_icon()
         self.connect("delete-event", self.on_delete_event)
 
-        # Initial stats chart
-        self.update_stats_chart()
-
     # ========== Timer Tab ==========
     def build_timer_tab(self):
         # Session label (Focus/Break)
@@ -166,32 +238,41 @@ class ChronixTimer(Gtk.Window):
         # Initialize labels
         self.update_session_label()
 
+    def _session_secs(self):
+        # Duration of the current session type in seconds
+        return settings[DURATION_KEYS[self.current_session]] * 60
+
     def update_session_label(self):
         text = f"{self.current_session} Session"
-        self.session_label.set_text(text)
+        if text != self._last_session_text:
+            self.session_label.set_text(text)
+            self._last_session_text = text
         # Display default time for the current session
-        duration = settings["focus_duration"] * 60 if self.current_session == "Focus" else \
-                   settings["short_break"] * 60 if self.current_session == "Short Break" else \
-                   settings["long_break"] * 60
-        self.update_time_label(duration)
+        self.update_time_label(self._session_secs())
 
     def update_time_label(self, secs):
         mins = secs // 60
         secs = secs % 60
-        self.time_label.set_text(f"{mins:02d}:{secs:02d}")
+        text = f"{mins:02d}:{secs:02d}"
+        # Identical text would still trigger a Pango relayout, so skip it
+        if text != self._last_time_text:
+            self.time_label.set_text(text)
+            self._last_time_text = text
 
     def on_start_stop(self, widget):
         if self.timer_id is None:
             # Start timer countdown
             if self.remaining == 0:
                 # Set remaining time for new session
-                self.remaining = settings["focus_duration"]*60 if self.current_session == "Focus" else \
-                                 settings["short_break"]*60 if self.current_session == "Short Break" else \
-                                 settings["long_break"]*60
-            self.timer_id = GLib.timeout_add_seconds(1, self.on_tick)
+                self.remaining = self._session_secs()
+            # Track an absolute monotonic deadline; the tick only refreshes
+            # the label, so preemption or coarse scheduling can't drift it
+            self.deadline = GLib.get_monotonic_time() + self.remaining * 1_000_000
+            self.timer_id = GLib.timeout_add(self._ms_to_next_tick(), self.on_tick)
             self.start_button.set_label("Stop")
         else:
-            # Pause timer
+            # Pause timer, keeping the seconds left from the deadline
+            self.remaining = self.seconds_left()
             GLib.source_remove(self.timer_id)
             self.timer_id = None
             self.start_button.set_label("Start")
@@ -207,15 +288,33 @@ class ChronixTimer(Gtk.Window):
         self.update_session_label()
         self.start_button.set_label("Start")
 
+    def seconds_left(self):
+        # Whole seconds until the deadline, rounded up
+        return max(0, (self.deadline - GLib.get_monotonic_time() + 999_999) // 1_000_000)
+
+    def _ms_to_next_tick(self):
+        # Delay to just past the deadline's next whole-second boundary.
+        # timeout_add_seconds buckets into GLib's own one-second epoch,
+        # which can land anywhere within a second of the deadline and
+        # makes the label visibly lag or jump.
+        rem_us = self.deadline - GLib.get_monotonic_time()
+        if rem_us <= 0:
+            return 0
+        ms = (rem_us % 1_000_000) // 1000
+        return (ms or 1000) + 5
+
     def on_tick(self):
-        if self.remaining > 0:
-            self.remaining -= 1
-            self.update_time_label(self.remaining)
-            return True
+        remaining = self.seconds_left()
+        if remaining > 0:
+            self.update_time_label(remaining)
+            # Re-arm a one-shot for the next boundary instead of letting
+            # a repeating source drift
+            self.timer_id = GLib.timeout_add(self._ms_to_next_tick(), self.on_tick)
         else:
             # End of current session
+            self.timer_id = None
             self.on_session_end()
-            return False
+        return False
 
     def on_session_end(self):
         # Handle end of focus or break
@@ -227,8 +326,7 @@ class ChronixTimer(Gtk.Window):
             else:
                 next_session = "Short Break"
             # Update stats
-            today = datetime.date.today().isoformat()
-            stats[today] = stats.get(today, 0) + settings["focus_duration"]
+            stats[self._today()] += settings["focus_duration"]
             save_stats()
             # Notify and sound
             notification = Notify.Notification.new("Focus session ended", "Time for a break!", None)
@@ -252,105 +350,168 @@ class ChronixTimer(Gtk.Window):
         # Update stats chart
         self.update_stats_chart()
 
+    def _today(self):
+        # Today's ISO stats key, re-derived only when the day rolls over
+        day = datetime.date.today()
+        if day != self._today_date:
+            self._today_date = day
+            self._today_iso = day.isoformat()
+        return self._today_iso
+
     def play_sound(self, sound_file):
         if not sound_file:
             return
         try:
-            uri = Gst.filename_to_uri(sound_file)
-            player = Gst.ElementFactory.make("playbin", "player")
-            player.set_property("uri", uri)
-            player.set_state(Gst.State.PLAYING)
+            if self._player is None:
+                # One playbin reused for every alarm; a fresh element per
+                # play is never set back to NULL and leaks the pipeline
+                self._player = Gst.ElementFactory.make("playbin", "player")
+                bus = self._player.get_bus()
+                bus.add_signal_watch()
+                bus.connect("message::eos", self.on_sound_finished)
+                bus.connect("message::error", self.on_sound_finished)
+            uri = self._uri_cache.get(sound_file)
+            if uri is None:
+                uri = Gst.filename_to_uri(sound_file)
+                self._uri_cache[sound_file] = uri
+            self._player.set_state(Gst.State.NULL)
+            self._player.set_property("uri", uri)
+            self._player.set_state(Gst.State.PLAYING)
         except Exception as e:
             print("Error playing sound:", e)
 
+    def on_sound_finished(self, bus, message):
+        # Release the file and audio device once playback is done
+        self._player.set_state(Gst.State.NULL)
+
+    def on_tab_switch(self, notebook, page, page_num):
+        if page is self.stats_box and not self._stats_built:
+            self.build_stats_tab()
+            self._stats_built = True
+            self.stats_box.show_all()
+        elif page is self.stats_box and self._chart_dirty:
+            # Stats changed while the tab was hidden; repaint now
+            self._chart_dirty = False
+            self.chart_area.queue_draw()
+        elif page is self.settings_box and not self._settings_built:
+            self.build_settings_tab()
+            self._settings_built = True
+            self.settings_box.show_all()
+
     # ========== Stats Tab ==========
     def build_stats_tab(self):
-        # Matplotlib figure for stats
-        self.figure = Figure(figsize=(4,3))
-        self.ax = self.figure.add_subplot(111)
-        self.canvas = FigureCanvas(self.figure)
-        sw = Gtk.ScrolledWindow()
-        sw.add_with_viewport(self.canvas)
-        self.stats_box.pack_start(sw, True, True, 0)
+        # Seven bars don't justify matplotlib's Figure/Agg pipeline; a
+        # plain DrawingArea rendered with Cairo is a fraction of the cost
+        self.chart_area = Gtk.DrawingArea()
+        self.chart_area.connect("draw", self.on_chart_draw)
+        self.stats_box.pack_start(self.chart_area, True, True, 0)
 
     def update_stats_chart(self):
-        # Draw bar chart for last 7 days of focus minutes
-        self.ax.clear()
+        # Nothing to refresh until the tab has been opened; the draw
+        # handler reads the live stats dict anyway
+        if not self._stats_built:
+            return
+        # Don't paint a hidden page — just note that it is stale
+        page = self.notebook.get_nth_page(self.notebook.get_current_page())
+        if page is self.stats_box:
+            self.chart_area.queue_draw()
+        else:
+            self._chart_dirty = True
+
+    def on_chart_draw(self, widget, cr):
+        # Bar chart for last 7 days of focus minutes. The (label, key)
+        # window only changes at midnight, so rebuild it once per day
         today = datetime.date.today()
-        dates = []
-        values = []
-        for i in range(6, -1, -1):
-            day = today - datetime.timedelta(days=i)
-            dates.append(day.strftime("%a"))
-            values.append(stats.get(day.isoformat(), 0))
-        self.ax.bar(range(len(dates)), values, color='blue')
-        self.ax.set_xticks(range(len(dates)))
-        self.ax.set_xticklabels(dates)
-        self.ax.set_ylabel("Focus minutes")
-        self.figure.tight_layout()
-        self.canvas.draw()
+        if today != self._stats_cache_day:
+            self._stats_keys = [
+                ((today - datetime.timedelta(days=i)).strftime("%a"),
+                 (today - datetime.timedelta(days=i)).isoformat())
+                for i in range(6, -1, -1)
+            ]
+            self._stats_cache_day = today
+        dates = [label for label, _ in self._stats_keys]
+        values = [stats.get(key, 0) for _, key in self._stats_keys]
+
+        alloc = widget.get_allocation()
+        label_h = 20
+        chart_h = max(1, alloc.height - label_h - 10)
+        slot_w = alloc.width / len(values)
+        scale = chart_h / max(max(values), 1)
+
+        cr.set_font_size(12)
+        for i, (label, value) in enumerate(zip(dates, values)):
+            bar_w = slot_w * 0.7
+            x = i * slot_w + (slot_w - bar_w) / 2
+            bar_h = value * scale
+            # Bar
+            cr.set_source_rgb(0.2, 0.4, 0.9)
+            cr.rectangle(x, 10 + chart_h - bar_h, bar_w, bar_h)
+            cr.fill()
+            # Day label centered under the bar
+            cr.set_source_rgb(0.3, 0.3, 0.3)
+            extents = cr.text_extents(label)
+            cr.move_to(i * slot_w + (slot_w - extents.width) / 2,
+                       alloc.height - 5)
+            cr.show_text(label)
+            # Minutes above the bar, when there is anything to show
+            if value:
+                text = str(value)
+                extents = cr.text_extents(text)
+                cr.move_to(i * slot_w + (slot_w - extents.width) / 2,
+                           max(10, 10 + chart_h - bar_h - 4))
+                cr.show_text(text)
+        return False
 
     # ========== Settings Tab ==========
     def build_settings_tab(self):
+        # One Grid instead of a stack of HBoxes: a single layout pass
+        # over the cells instead of one resize negotiation per row
+        grid = Gtk.Grid(column_spacing=6, row_spacing=6)
+        self.settings_box.pack_start(grid, False, False, 0)
+
         # Focus duration
-        hbox = Gtk.HBox(spacing=6)
-        self.settings_box.pack_start(hbox, False, False, 0)
-        label = Gtk.Label(label="Focus duration (minutes):")
-        hbox.pack_start(label, False, False, 0)
+        grid.attach(Gtk.Label(label="Focus duration (minutes):"), 0, 0, 1, 1)
         adj_focus = Gtk.Adjustment(settings.get("focus_duration", 25), 1, 120, 1, 10, 0)
         self.spin_focus = Gtk.SpinButton(adjustment=adj_focus, climb_rate=1, digits=0)
         self.spin_focus.connect("value-changed", self.on_focus_changed)
-        hbox.pack_start(self.spin_focus, False, False, 0)
+        grid.attach(self.spin_focus, 1, 0, 1, 1)
 
         # Short break duration
-        hbox2 = Gtk.HBox(spacing=6)
-        self.settings_box.pack_start(hbox2, False, False, 0)
-        label2 = Gtk.Label(label="Short break (minutes):")
-        hbox2.pack_start(label2, False, False, 0)
-        adj_short = Gtk.Adjustment(settings.get("short_break", 5), 1, 60, 1, 5, 0)        
+        grid.attach(Gtk.Label(label="Short break (minutes):"), 0, 1, 1, 1)
+        adj_short = Gtk.Adjustment(settings.get("short_break", 5), 1, 60, 1, 5, 0)
         self.spin_short = Gtk.SpinButton(adjustment=adj_short, climb_rate=1, digits=0)
         self.spin_short.connect("value-changed", self.on_short_changed)
-        hbox2.pack_start(self.spin_short, False, False, 0)
+        grid.attach(self.spin_short, 1, 1, 1, 1)
 
         # Long break duration
-        hbox3 = Gtk.HBox(spacing=6)
-        self.settings_box.pack_start(hbox3, False, False, 0)
-        label3 = Gtk.Label(label="Long break (minutes):")
-        hbox3.pack_start(label3, False, False, 0)
+        grid.attach(Gtk.Label(label="Long break (minutes):"), 0, 2, 1, 1)
         adj_long = Gtk.Adjustment(settings.get("long_break", 15), 1, 60, 1, 5, 0)
         self.spin_long = Gtk.SpinButton(adjustment=adj_long, climb_rate=1, digits=0)
         self.spin_long.connect("value-changed", self.on_long_changed)
-        hbox3.pack_start(self.spin_long, False, False, 0)
+        grid.attach(self.spin_long, 1, 2, 1, 1)
 
         # Auto-start switch
-        hbox4 = Gtk.HBox(spacing=6)
-        self.settings_box.pack_start(hbox4, False, False, 0)
-        label4 = Gtk.Label(label="Auto-start next session:")
-        hbox4.pack_start(label4, False, False, 0)
+        grid.attach(Gtk.Label(label="Auto-start next session:"), 0, 3, 1, 1)
         self.switch_autostart = Gtk.Switch()
         self.switch_autostart.set_active(settings.get("auto_start", False))
         self.switch_autostart.connect("state-set", self.on_autostart_toggled)
-        hbox4.pack_start(self.switch_autostart, False, False, 0)
+        grid.attach(self.switch_autostart, 1, 3, 1, 1)
 
         # Focus end sound chooser
-        hbox5 = Gtk.HBox(spacing=6)
-        self.settings_box.pack_start(hbox5, False, False, 0)
-        label5 = Gtk.Label(label="Focus end sound:")
-        hbox5.pack_start(label5, False, False, 0)
+        grid.attach(Gtk.Label(label="Focus end sound:"), 0, 4, 1, 1)
         self.filebtn_focus = Gtk.FileChooserButton(title="Select focus end sound", action=Gtk.FileChooserAction.OPEN)
         self.filebtn_focus.set_filename(settings.get("focus_sound", default_focus_sound))
         self.filebtn_focus.connect("file-set", self.on_focus_sound_selected)
-        hbox5.pack_start(self.filebtn_focus, True, True, 0)
+        self.filebtn_focus.set_hexpand(True)
+        grid.attach(self.filebtn_focus, 1, 4, 1, 1)
 
         # Break end sound chooser
-        hbox6 = Gtk.HBox(spacing=6)
-        self.settings_box.pack_start(hbox6, False, False, 0)
-        label6 = Gtk.Label(label="Break end sound:")
-        hbox6.pack_start(label6, False, False, 0)
+        grid.attach(Gtk.Label(label="Break end sound:"), 0, 5, 1, 1)
         self.filebtn_break = Gtk.FileChooserButton(title="Select break end sound", action=Gtk.FileChooserAction.OPEN)
         self.filebtn_break.set_filename(settings.get("break_sound", default_break_sound))
         self.filebtn_break.connect("file-set", self.on_break_sound_selected)
-        hbox6.pack_start(self.filebtn_break, True, True, 0)
+        self.filebtn_break.set_hexpand(True)
+        grid.attach(self.filebtn_break, 1, 5, 1, 1)
 
     # Callbacks for settings changes
     def on_focus_changed(self, widget):
@@ -383,10 +544,20 @@ class ChronixTimer(Gtk.Window):
     def build_tray_icon(self):
         try:
             self.status_icon = Gtk.StatusIcon()
-            icon_path = default_icon if os.path.isfile(default_icon) else ""
-            self.status_icon.set_from_file(icon_path)
+            if os.path.isfile(default_icon):
+                self.status_icon.set_from_file(default_icon)
             self.status_icon.connect('activate', self.on_tray_left_click)
             self.status_icon.connect('popup-menu', self.on_tray_right_click)
+            # The menu never changes, so build it once instead of
+            # allocating widgets on every right-click
+            self._tray_menu = Gtk.Menu()
+            show_item = Gtk.MenuItem(label="Show/Hide")
+            quit_item = Gtk.MenuItem(label="Quit")
+            show_item.connect("activate", lambda _: self.on_tray_left_click(self.status_icon))
+            quit_item.connect("activate", Gtk.main_quit)
+            self._tray_menu.append(show_item)
+            self._tray_menu.append(quit_item)
+            self._tray_menu.show_all()
         except Exception as e:
             print("Could not create tray icon:", e)
 
@@ -398,16 +569,7 @@ class ChronixTimer(Gtk.Window):
             self.show_all()
 
     def on_tray_right_click(self, icon, button, time):
-        menu = Gtk.Menu()
-        show_item = Gtk.MenuItem(label="Show/Hide")
-        quit_item = Gtk.MenuItem(label="Quit")
-        show_item.connect("activate", lambda _: self.on_tray_left_click(icon))
-        quit_item.connect("activate", Gtk.main_quit)
-        menu.append(show_item)
-        menu.append(quit_item)
-        show_item.show()
-        quit_item.show()
-        menu.popup(None, None, None, None, button, time)
+        self._tray_menu.popup(None, None, None, None, button, time)
 
     def on_delete_event(self, widget, event):
         # Minimize to tray instead of quitting
@@ -415,6 +577,12 @@ class ChronixTimer(Gtk.Window):
         return True
 
 if __name__ == "__main__":
+    # GTK needs a display; bail out with a clear message instead of an
+    # opaque X11 abort after all the widget setup has run
+    if not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY"):
+        sys.exit("Chronix needs a graphical session (no DISPLAY found).")
+    # Settings/stats must be in place before widgets read them
+    _loader.join()
     win = ChronixTimer()
     win.show_all()
     Gtk.main()